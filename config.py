@@ -4,7 +4,10 @@ Developer: Latiful Hassan Zihan
 Telegram: t.me/alwayszihan
 """
 
+import json
 import os
+import threading
+import types
 from colorama import Fore, Style
 
 # Project Info
@@ -15,8 +18,30 @@ VERSION = "2.0.0"
 
 # File Paths
 RESULTS_DIR = "results"
+CONFIG_FILE = "config.json"
 os.makedirs(RESULTS_DIR, exist_ok=True)
 
+# Parsed config cache - re-read only when the file changes on disk
+_CFG_CACHE = {'mtime': -1, 'data': None}
+_CFG_LOCK = threading.Lock()
+
+def load_config():
+    """Load optional user overrides from config.json (mtime-cached)"""
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return {}
+
+    with _CFG_LOCK:
+        if st.st_mtime_ns != _CFG_CACHE['mtime'] or _CFG_CACHE['data'] is None:
+            try:
+                with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
+                    _CFG_CACHE['data'] = json.load(f)
+                _CFG_CACHE['mtime'] = st.st_mtime_ns
+            except (OSError, ValueError):
+                return {}
+        return dict(_CFG_CACHE['data'])
+
 # Colors
 COLORS = {
     'success': Fore.GREEN,
@@ -28,8 +53,8 @@ COLORS = {
     'reset': Style.RESET_ALL
 }
 
-# Country Codes
-COUNTRY_CODES = {
+# Country Codes (read-only - lookups bind get_country_name below)
+COUNTRY_CODES = types.MappingProxyType({
     'BD': 'Bangladesh',
     'IN': 'India',
     'US': 'United States',
@@ -40,6 +65,38 @@ COUNTRY_CODES = {
     'CA': 'Canada',
     'AU': 'Australia',
     'SG': 'Singapore'
+})
+
+get_country_name = COUNTRY_CODES.get
+
+# Calling-code prefix -> country code, probed longest-prefix-first.
+# The shared NANP prefix '1' defaults to US.
+CALLING_CODES = {
+    '880': 'BD',
+    '91': 'IN',
+    '1': 'US',
+    '44': 'UK',
+    '971': 'AE',
+    '966': 'SA',
+    '92': 'PK',
+    '61': 'AU',
+    '65': 'SG'
+}
+
+def detect_country_code(number):
+    """Guess the country from a +<digits> number's calling prefix"""
+    digits = str(number).lstrip('+')
+    for length in (3, 2, 1):
+        country = CALLING_CODES.get(digits[:length])
+        if country:
+            return country
+    return None
+
+# Per-country fixups for trunk-prefixed numbers ('+0...'), applied after
+# generic cleaning. One dict lookup instead of a growing if-ladder.
+NORMALIZERS = {
+    'BD': lambda n: '+880' + n.lstrip('+0') if n.startswith('+0') else n,
+    'IN': lambda n: '+91' + n.lstrip('+0') if n.startswith('+0') else n,
 }
 
 # Installation check
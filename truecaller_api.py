@@ -2,16 +2,113 @@
 Truecaller API Handler for Xloockup using truecallerpy
 """
 
+import asyncio
+import json
+import os
+import sqlite3
+import threading
 import time
-from truecallerpy import search_phonenumber
-from utils import print_message, validate_phone_number
-from config import COUNTRY_CODES
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from itertools import islice
+from utils import append_result_jsonl, print_message, validate_phone_number, validate_phone_numbers_batch
+from config import NORMALIZERS, RESULTS_DIR, get_country_name, load_config
+
+def _no_fixup(number):
+    return number
+
+def _chunked(iterable, size):
+    """Yield successive lists of up to `size` items"""
+    it = iter(iterable)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+class RateLimiter:
+    """Deadline-based limiter - sleeps only when calls outpace the interval"""
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self._next_ok = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Reserve the next request slot, sleeping off any remaining wait"""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_ok - now
+            self._next_ok = max(now, self._next_ok) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
 
 class TruecallerAPI:
     def __init__(self):
-        self.request_count = 0
+        config = load_config()
         # You need to get this from Truecaller developer account
-        self.api_key = "a1i0k--f2b4046a6f199a1d4a7e7a7b7d9a5d8e0e8f2c3"
+        self.api_key = config.get(
+            'api_key',
+            "a1i0k--f2b4046a6f199a1d4a7e7a7b7d9a5d8e0e8f2c3"
+        )
+        # Shared pool so a hung API call can't block a lookup forever
+        self._executor = ThreadPoolExecutor(max_workers=8)
+        self.timeout = 15
+        self.max_retries = 3
+        # Recent answers keyed by (number, country) so duplicate lookups
+        # skip the network entirely
+        self._cache = {}
+        self.cache_ttl = 600
+        # Disk cache so repeat bulk jobs skip the network across runs
+        self._db = None
+        self._db_lock = threading.Lock()
+        self.disk_cache_ttl = config.get('disk_cache_ttl', 86400)
+        # One request per rate_limit_delay seconds (config-overridable)
+        self._limiter = RateLimiter(config.get('rate_limit_delay', 1.0))
+        # truecallerpy is imported on first use so menu-only sessions
+        # don't pay its import cost at startup
+        self._search_fn = None
+
+    def _get_db(self):
+        """Open (or create) the on-disk lookup cache"""
+        if self._db is None:
+            path = os.path.join(RESULTS_DIR, 'cache.sqlite')
+            db = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+            db.execute('PRAGMA journal_mode=WAL')
+            db.execute('PRAGMA synchronous=NORMAL')
+            db.execute(
+                'CREATE TABLE IF NOT EXISTS lookups '
+                '(num TEXT PRIMARY KEY, ts INTEGER, blob TEXT)'
+            )
+            self._db = db
+        return self._db
+
+    def _disk_cache_get(self, cache_key):
+        """Fetch a fresh-enough cached response from disk, or None"""
+        try:
+            with self._db_lock:
+                row = self._get_db().execute(
+                    'SELECT ts, blob FROM lookups WHERE num = ?',
+                    ('%s:%s' % cache_key,)
+                ).fetchone()
+            if row and time.time() - row[0] < self.disk_cache_ttl:
+                return json.loads(row[1])
+        except Exception:
+            pass
+        return None
+
+    def _disk_cache_put(self, cache_key, response):
+        """Store a successful response in the disk cache"""
+        try:
+            with self._db_lock:
+                self._get_db().execute(
+                    'INSERT OR REPLACE INTO lookups (num, ts, blob) VALUES (?, ?, ?)',
+                    ('%s:%s' % cache_key, int(time.time()), json.dumps(response))
+                )
+        except Exception:
+            pass
+
+    def _get_search_fn(self):
+        """Import truecallerpy lazily and cache the search function"""
+        if self._search_fn is None:
+            from truecallerpy import search_phonenumber
+            self._search_fn = search_phonenumber
+        return self._search_fn
     
     def search_number(self, phone_number, country_code="IN"):
         """
@@ -22,28 +119,59 @@ class TruecallerAPI:
             if not is_valid:
                 print_message('error', f"Invalid phone number: {cleaned_number}")
                 return None
-            
-            country_name = COUNTRY_CODES.get(country_code, country_code)
+
+            # Apply the country-specific trunk-prefix fixup, if any
+            cleaned_number = NORMALIZERS.get(country_code, _no_fixup)(cleaned_number)
+
+            cache_key = (cleaned_number, country_code)
+            cached = self._cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.cache_ttl:
+                print_message('info', f"Using cached result for {cleaned_number}")
+                return cached[1]
+
+            disk_cached = self._disk_cache_get(cache_key)
+            if disk_cached is not None:
+                print_message('info', f"Using saved result for {cleaned_number}")
+                self._cache[cache_key] = (time.monotonic(), disk_cached)
+                return disk_cached
+
+            country_name = get_country_name(country_code, country_code)
             print_message('info', f"Searching: {cleaned_number} ({country_name})")
             
-            # Rate limiting
-            self.request_count += 1
-            if self.request_count % 3 == 0:
-                print_message('warning', "Rate limiting - waiting 2 seconds...")
-                time.sleep(2)
-            
-            # Use truecallerpy to search
-            print_message('info', "Using truecallerpy API...")
-            
-            response = search_phonenumber(
-                cleaned_number, 
-                country_code, 
-                self.api_key
-            )
-            
+            # Rate limiting - only waits out whatever time is actually
+            # left until the next allowed slot
+            self._limiter.acquire()
+
+            response = None
+            for attempt in range(self.max_retries):
+                if attempt:
+                    # Exponential backoff before retrying transient failures
+                    time.sleep(0.3 * (2 ** (attempt - 1)))
+                    print_message('warning', f"Retrying ({attempt + 1}/{self.max_retries})...")
+
+                future = self._executor.submit(
+                    self._get_search_fn(),
+                    cleaned_number,
+                    country_code,
+                    self.api_key
+                )
+                try:
+                    response = future.result(timeout=self.timeout)
+                    break
+                except FutureTimeoutError:
+                    future.cancel()
+                except (ConnectionError, OSError):
+                    pass
+
+            if response is None:
+                print_message('error', f"Lookup failed after {self.max_retries} attempts")
+                return {"error": "Lookup timed out"}
+
             if response and 'data' in response:
                 if response['data']:
                     print_message('success', "Lookup successful!")
+                    self._cache[cache_key] = (time.monotonic(), response)
+                    self._disk_cache_put(cache_key, response)
                     return response
                 else:
                     print_message('error', "No data found for this number")
@@ -67,21 +195,77 @@ class TruecallerAPI:
                 print_message('error', f"API Error: {error_msg}")
                 return {"error": error_msg}
     
-    def bulk_search(self, phone_numbers, country_code="IN"):
-        """Search multiple phone numbers"""
+    async def _search_async(self, semaphore, number, country_code):
+        """Run one lookup in a worker thread, gated by the semaphore"""
+        async with semaphore:
+            # Pacing happens inside search_number's rate limiter
+            result = await asyncio.to_thread(self.search_number, number, country_code)
+            return number, result
+
+    async def _bulk_async(self, phone_numbers, country_code, concurrency=5,
+                          stream_to=None, batch_size=50):
+        """Fan out lookups with at most `concurrency` in flight at once
+
+        Numbers are dispatched in batches of `batch_size` so very large
+        jobs hold a bounded number of pending tasks rather than one per
+        number up front.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+        total = len(phone_numbers)
+        done = 0
+
+        async def tracked(number):
+            nonlocal done
+            pair = await self._search_async(semaphore, number, country_code)
+            done += 1
+            if stream_to:
+                # Crash-safe partial results: one line per finished lookup
+                append_result_jsonl({'number': pair[0], 'result': pair[1]}, stream_to)
+            # Periodic progress only - a line per lookup drowns bulk runs
+            if done % 5 == 0 or done == total:
+                print_message('info', f"Progress: {done}/{total}")
+            return pair
+
         results = {}
+        for batch in _chunked(phone_numbers, batch_size):
+            results.update(await asyncio.gather(*[tracked(n) for n in batch]))
+        return results
+
+    def bulk_search(self, phone_numbers, country_code="IN", stream_to=None):
+        """Search multiple phone numbers concurrently
+
+        With stream_to set, every finished lookup is appended to that
+        ND-JSON file immediately, so a crash keeps partial results.
+        """
         total = len(phone_numbers)
-        
+
         print_message('info', f"Starting bulk search for {total} numbers...")
-        
-        for i, number in enumerate(phone_numbers, 1):
-            print_message('info', f"Progress: {i}/{total} - Processing: {number}")
-            results[number] = self.search_number(number, country_code)
-            
-            # Add delay between requests to avoid rate limiting
-            if i < total:
-                time.sleep(1)
-        
+
+        # Drop duplicate entries (order-preserving) and validate the
+        # whole batch up front so neither costs a network round-trip
+        phone_numbers = list(dict.fromkeys(phone_numbers))
+        results = {}
+        valid_numbers = []
+        for number, (is_valid, cleaned) in zip(
+            phone_numbers, validate_phone_numbers_batch(phone_numbers)
+        ):
+            if is_valid:
+                valid_numbers.append(number)
+            else:
+                print_message('error', f"Invalid phone number: {cleaned}")
+                results[number] = None
+
+        if len(valid_numbers) < 3:
+            # Not worth spinning up the event loop and worker threads
+            for number in valid_numbers:
+                results[number] = self.search_number(number, country_code)
+                if stream_to:
+                    append_result_jsonl({'number': number, 'result': results[number]}, stream_to)
+        else:
+            results.update(asyncio.run(
+                self._bulk_async(valid_numbers, country_code, stream_to=stream_to)
+            ))
+
         print_message('success', f"Bulk search completed! Processed {total} numbers")
         return results
     
@@ -89,9 +273,9 @@ class TruecallerAPI:
         """Check API status"""
         try:
             # Test with a sample number
-            test_response = search_phonenumber(
-                "+911234567890", 
-                "IN", 
+            test_response = self._get_search_fn()(
+                "+911234567890",
+                "IN",
                 self.api_key
             )
             return test_response is not None
@@ -2,18 +2,62 @@
 Utility Functions for Xloockup
 """
 
+import bisect
 import json
 import os
 import re
-from datetime import datetime
-from colorama import Fore, Style, init
+import sys
+import time
+from colorama import init
 from config import COLORS, RESULTS_DIR
 
-# Initialize colorama
-init(autoreset=True)
+# orjson is much faster at encoding results, ujson a close second;
+# both are optional and stdlib json remains the final fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ujson
+except ImportError:
+    ujson = None
 
-def print_banner():
-    banner = f"""
+# Initialize colorama exactly once, no matter how many entry points
+# import this module
+if not getattr(init, '_xloockup_initialized', False):
+    init(autoreset=True)
+    init._xloockup_initialized = True
+
+# Compiled once - these run per number on the bulk path
+_PHONE_RE = re.compile(r'[^\d+]')
+_FNAME_RE = re.compile(r'[^\w]')
+
+# Every accepted shape as one alternation - a single fullmatch both
+# validates the cleaned string and names which fixup applies
+_NORMALIZE_RE = re.compile(
+    r'(?P<bd_local>01\d{9})'   # Bangladesh with trunk 0: 017... -> +88017...
+    r'|(?P<bd_bare>1\d{9})'    # Bangladesh without trunk 0: 1... -> +8801...
+    r'|(?P<in_bare>91\d{10})'  # India with calling code: 91... -> +91...
+    r'|(?P<intl>\+\d{8,15})'   # already canonical +<digits> (E.164 cap)
+    r'|(?P<bare>\d{8,15})'     # other bare digits - just add '+'
+)
+
+_PREFIXERS = {
+    'bd_local': lambda s: '+880' + s[1:],
+    'bd_bare': lambda s: '+8801' + s,
+    'in_bare': lambda s: '+' + s,
+    'intl': lambda s: s,
+    'bare': lambda s: '+' + s,
+}
+
+# Deletes every ASCII character that isn't a digit or '+' in one C-level
+# pass - used for batch cleaning where the regex overhead adds up
+_PHONE_TRANS = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if chr(c) not in '0123456789+')
+)
+
+# Built once - the banner never changes at runtime
+_BANNER = f"""
 {COLORS['cyan']}
 ╔══════════════════════════════════════════════╗
 ║                  {COLORS['magenta']}XLOOCKUP{COLORS['cyan']}                   ║
@@ -24,163 +68,280 @@ def print_banner():
 ╚══════════════════════════════════════════════╝
 {COLORS['reset']}
 """
-    print(banner)
+
+def print_banner():
+    print(_BANNER)
+
+# Colored message prefixes, built once so the per-call cost is a single
+# dict lookup and one write
+_PREFIX = {
+    'success': f"{COLORS['success']}[✓] ",
+    'error': f"{COLORS['error']}[✗] ",
+    'warning': f"{COLORS['warning']}[!] ",
+    'info': f"{COLORS['info']}[i] "
+}
+_RESET = COLORS['reset']
 
 def print_message(message_type, message):
-    colors = {
-        'success': COLORS['success'],
-        'error': COLORS['error'],
-        'warning': COLORS['warning'],
-        'info': COLORS['info']
-    }
-    symbols = {
-        'success': '[✓]',
-        'error': '[✗]',
-        'warning': '[!]',
-        'info': '[i]'
-    }
-    print(f"{colors[message_type]}{symbols[message_type]} {message}{COLORS['reset']}")
+    sys.stdout.write(f"{_PREFIX[message_type]}{message}{_RESET}\n")
 
 def validate_phone_number(number):
     """Validate and clean phone number"""
-    # Remove all non-digit characters except +
-    cleaned = re.sub(r'[^\d+]', '', str(number))
-    
+    # Fast path: input already in canonical +<digits> form
+    if (isinstance(number, str) and number[:1] == '+'
+            and number[1:].isdigit() and 9 <= len(number) <= 16):
+        return True, number
+
+    # Remove all non-digit characters except + - str.translate for the
+    # common ASCII case, regex for anything else
+    text = str(number)
+    if text.isascii():
+        cleaned = text.translate(_PHONE_TRANS)
+    else:
+        cleaned = _PHONE_RE.sub('', text)
+    return _normalize_cleaned(cleaned)
+
+def validate_phone_numbers_batch(numbers):
+    """Validate a whole batch of numbers, cleaning via str.translate"""
+    results = []
+    for number in numbers:
+        text = str(number)
+        if text.isascii():
+            cleaned = text.translate(_PHONE_TRANS)
+        else:
+            cleaned = _PHONE_RE.sub('', text)
+        results.append(_normalize_cleaned(cleaned))
+    return results
+
+def _normalize_cleaned(cleaned):
+    """Normalize an already-cleaned number and check its shape"""
     if not cleaned:
         return False, "Empty phone number"
-    
-    # Handle different formats
-    if cleaned.startswith('01') and len(cleaned) == 11:
-        # Bangladesh: 017... to +88017...
-        cleaned = '+880' + cleaned[1:]
-    elif cleaned.startswith('1') and len(cleaned) == 10:
-        # Bangladesh: 1... to +8801...
-        cleaned = '+8801' + cleaned
-    elif cleaned.startswith('91') and len(cleaned) == 12:
-        # India: 91... to +91...
-        cleaned = '+' + cleaned
-    elif not cleaned.startswith('+'):
-        # Add + if missing
-        cleaned = '+' + cleaned
-    
-    # Basic length validation
-    if len(cleaned) < 10:
-        return False, "Phone number too short"
-    
-    return True, cleaned
-
-def save_results(phone_number, data, search_type="single"):
-    """Save lookup results to JSON file"""
+
+    # One regex pass decides validity and picks the matching fixup via
+    # the named group, replacing the old startswith/len ladder plus a
+    # second structural check
+    match = _NORMALIZE_RE.fullmatch(cleaned)
+    if match is None:
+        return False, "Invalid phone number format"
+
+    return True, _PREFIXERS[match.lastgroup](cleaned)
+
+def _batch_ts():
+    """Timestamp suffix - compute once per batch and share via the ts kwarg"""
+    t = time.localtime()
+    return (f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}"
+            f"_{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}")
+
+def save_results(phone_number, data, search_type="single", ts=None, pretty=False):
+    """Save lookup results to JSON file (compact unless pretty=True)"""
     try:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = ts or _batch_ts()
         if search_type == "single":
-            clean_phone = re.sub(r'[^\w]', '_', phone_number)
+            clean_phone = _FNAME_RE.sub('_', phone_number)
             filename = f"xloockup_{clean_phone}_{timestamp}.json"
         else:
             filename = f"xloockup_bulk_{timestamp}.json"
         
         filepath = os.path.join(RESULTS_DIR, filename)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        
+
+        # Serialize fully before touching the file so the write is one
+        # buffer handed to the OS, not many small encoder chunks
+        if orjson is not None:
+            opts = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                opts |= orjson.OPT_INDENT_2
+            buf = orjson.dumps(data, option=opts)
+        elif ujson is not None:
+            buf = ujson.dumps(data, indent=2 if pretty else 0, ensure_ascii=False).encode('utf-8')
+        elif pretty:
+            buf = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        else:
+            buf = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        with open(filepath, 'wb') as f:
+            f.write(buf)
+
         print_message('success', f"Results saved to: {filepath}")
         return filepath
     except Exception as e:
         print_message('error', f"Failed to save results: {str(e)}")
         return None
 
+def save_results_bulk(results_dict):
+    """Save an entire bulk batch with a single write"""
+    return save_results("bulk_search", results_dict, "bulk")
+
+# Second-resolution timestamp cache - bulk streaming stamps many records
+# within the same second, so only rebuild the string when the clock ticks
+_TS_CACHE = [0, '']
+
+def _cached_ts():
+    """Current 'YYYY-mm-dd HH:MM:SS' string, recomputed once per second"""
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[0] = now
+        _TS_CACHE[1] = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+    return _TS_CACHE[1]
+
+def append_result_jsonl(result, filepath):
+    """Append one result to an ND-JSON file - O(1) instead of a rewrite"""
+    try:
+        if isinstance(result, dict) and 'ts' not in result:
+            result = {'ts': _cached_ts(), **result}
+        if orjson is not None:
+            line = orjson.dumps(result)
+        else:
+            line = json.dumps(result, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        with open(filepath, 'ab') as f:
+            f.write(line + b'\n')
+        return filepath
+    except Exception as e:
+        print_message('error', f"Failed to append result: {str(e)}")
+        return None
+
+# Directory listing cache, invalidated when RESULTS_DIR's mtime changes
+_LISTING_CACHE = {'mtime': -1, 'files': []}
+
 def load_results():
-    """Load all saved results files"""
+    """Load all saved results files, newest first"""
     try:
-        if not os.path.exists(RESULTS_DIR):
-            return []
-        
-        files = [f for f in os.listdir(RESULTS_DIR) if f.endswith('.json')]
-        return sorted(files, reverse=True)
+        dir_mtime = os.stat(RESULTS_DIR).st_mtime_ns
+        if dir_mtime == _LISTING_CACHE['mtime']:
+            return _LISTING_CACHE['files']
+
+        with os.scandir(RESULTS_DIR) as it:
+            entries = [
+                (entry.stat().st_mtime_ns, entry.name) for entry in it
+                if entry.is_file() and entry.name.endswith(('.json', '.jsonl'))
+            ]
+        entries.sort(reverse=True)
+        files = [name for _, name in entries]
+        _LISTING_CACHE['mtime'] = dir_mtime
+        _LISTING_CACHE['files'] = files
+        return files
+    except FileNotFoundError:
+        return []
     except Exception as e:
         print_message('error', f"Failed to load results: {str(e)}")
         return []
 
+# Color codes bound once so per-record rendering only touches locals
+_C_INFO = COLORS['info']
+_C_SUCCESS = COLORS['success']
+_C_WARNING = COLORS['warning']
+_C_ERROR = COLORS['error']
+
+# Color tiers as (thresholds, labels) pairs - bisect_left keeps the
+# strict greater-than semantics and adding a tier is just a new entry
+_SPAM_THRESH = (40, 70)
+_SPAM_STATUS = (f"{_C_SUCCESS}CLEAN", f"{_C_WARNING}MEDIUM SPAM", f"{_C_ERROR}HIGH SPAM")
+_SCORE_THRESH = (60, 80)
+_SCORE_COLORS = (_C_ERROR, _C_WARNING, _C_SUCCESS)
+
+def _fmt_spam(spam_score):
+    """Colored spam status for a spam score"""
+    return _SPAM_STATUS[bisect.bisect_left(_SPAM_THRESH, spam_score)]
+
+def _score_color(score):
+    """Color for a confidence score"""
+    return _SCORE_COLORS[bisect.bisect_left(_SCORE_THRESH, score)]
+
+def _extract_record(data):
+    """Flatten the fields display_result cares about in one pass"""
+    get = data.get
+    record = {
+        'name': get('name'),
+        'carrier': None,
+        'type': None,
+        'city': None,
+        'country': None,
+        'email': None,
+        'spam_score': get('spamScore', 0),
+        'spam_type': get('spamType', 'Not Spam'),
+        'score': get('score', 0)
+    }
+
+    phones = get('phones')
+    if phones:
+        phone_info = phones[0]
+        record['carrier'] = phone_info.get('carrier', 'Not Available')
+        record['type'] = phone_info.get('type', 'Not Available')
+
+    addresses = get('addresses')
+    if addresses:
+        address_info = addresses[0]
+        record['city'] = address_info.get('city')
+        record['country'] = address_info.get('countryCode')
+
+    for internet_addr in get('internetAddresses') or ():
+        email = internet_addr.get('id', '')
+        if '@' in email:
+            record['email'] = email
+            break
+
+    return record
+
 def display_result(result, phone_number):
     """Display lookup results in formatted way"""
     if not result:
         print_message('error', f"No results received for {phone_number}")
         return
-        
+
     if 'error' in result:
         print_message('error', f"Error: {result['error']}")
         return
-    
-    print(f"\n{COLORS['success']}=== XLOOCKUP RESULTS ==={COLORS['reset']}")
-    print(f"{COLORS['info']}Phone: {COLORS['reset']}{phone_number}")
-    
-    # Extract data from truecallerpy response
-    data = result.get('data', [{}])[0] if result.get('data') else {}
-    
-    # Name information
-    name = data.get('name', 'Not Available')
+
+    c_info, c_reset, c_success = _C_INFO, _RESET, _C_SUCCESS
+
+    # Build the whole record as one buffer and write it in a single call
+    lines = [
+        f"\n{c_success}=== XLOOCKUP RESULTS ==={c_reset}",
+        f"{c_info}Phone: {c_reset}{phone_number}"
+    ]
+
+    # Extract data from truecallerpy response - only the first record
+    # is ever displayed
+    data_list = result.get('data')
+    record = _extract_record(data_list[0] if data_list else {})
+
+    name = record['name']
     if name and name != 'Not Available':
-        print(f"{COLORS['info']}Name: {COLORS['reset']}{name}")
-    
-    # Phone information
-    if data.get('phones'):
-        phone_info = data['phones'][0]
-        carrier = phone_info.get('carrier', 'Not Available')
-        number_type = phone_info.get('type', 'Not Available')
-        
-        print(f"{COLORS['info']}Carrier: {COLORS['reset']}{carrier}")
-        print(f"{COLORS['info']}Type: {COLORS['reset']}{number_type}")
-    
-    # Address information
-    if data.get('addresses'):
-        address_info = data['addresses'][0]
-        city = address_info.get('city', 'Not Available')
-        country = address_info.get('countryCode', 'Not Available')
-        
-        if city and city != 'Not Available':
-            print(f"{COLORS['info']}City: {COLORS['reset']}{city}")
-        if country and country != 'Not Available':
-            print(f"{COLORS['info']}Country: {COLORS['reset']}{country}")
-    
-    # Email information
-    if data.get('internetAddresses'):
-        for internet_addr in data['internetAddresses']:
-            email = internet_addr.get('id', '')
-            if '@' in email:
-                print(f"{COLORS['info']}Email: {COLORS['reset']}{email}")
-                break
-    
-    # Spam information
-    spam_score = data.get('spamScore', 0)
-    spam_type = data.get('spamType', 'Not Spam')
-    
-    if spam_score > 70:
-        spam_status = f"{COLORS['error']}HIGH SPAM"
-    elif spam_score > 40:
-        spam_status = f"{COLORS['warning']}MEDIUM SPAM"
-    else:
-        spam_status = f"{COLORS['success']}CLEAN"
-    
-    print(f"{COLORS['info']}Spam Score: {COLORS['reset']}{spam_score} - {spam_status}")
-    print(f"{COLORS['info']}Spam Type: {COLORS['reset']}{spam_type}")
-    
-    # Confidence score
-    score = data.get('score', 0)
-    if score > 80:
-        score_color = COLORS['success']
-    elif score > 60:
-        score_color = COLORS['warning']
-    else:
-        score_color = COLORS['error']
-    
-    print(f"{COLORS['info']}Confidence: {score_color}{score}%{COLORS['reset']}")
-    
-    print(f"{COLORS['success']}{'='*40}{COLORS['reset']}")
+        lines.append(f"{c_info}Name: {c_reset}{name}")
+
+    if record['carrier'] is not None:
+        lines.append(f"{c_info}Carrier: {c_reset}{record['carrier']}")
+        lines.append(f"{c_info}Type: {c_reset}{record['type']}")
+
+    if record['city'] and record['city'] != 'Not Available':
+        lines.append(f"{c_info}City: {c_reset}{record['city']}")
+    if record['country'] and record['country'] != 'Not Available':
+        lines.append(f"{c_info}Country: {c_reset}{record['country']}")
+
+    if record['email']:
+        lines.append(f"{c_info}Email: {c_reset}{record['email']}")
+
+    spam_score = record['spam_score']
+    lines.append(f"{c_info}Spam Score: {c_reset}{spam_score} - {_fmt_spam(spam_score)}")
+    lines.append(f"{c_info}Spam Type: {c_reset}{record['spam_type']}")
+
+    score = record['score']
+    lines.append(f"{c_info}Confidence: {_score_color(score)}{score}%{c_reset}")
+
+    lines.append(f"{c_success}{'='*40}{c_reset}\n")
+    sys.stdout.write('\n'.join(lines))
+
+# ANSI "erase display" + "cursor home" - a 7-byte write instead of a
+# fork+exec of the clear/cls binary
+_CLEAR_SEQ = '\x1b[2J\x1b[H'
 
 def clear_screen():
     """Clear terminal screen"""
-    os.system('clear' if os.name == 'posix' else 'cls')
+    if sys.stdout.isatty():
+        sys.stdout.write(_CLEAR_SEQ)
+        sys.stdout.flush()
+    else:
+        os.system('clear' if os.name == 'posix' else 'cls')
 
 def format_phone_for_display(phone):
     """Format phone number for better display"""
@@ -9,14 +9,18 @@ Powered by truecallerpy
 import sys
 import json
 import os
-from colorama import init
+import re
+import time
 
-# Initialize colorama
-init(autoreset=True)
+# Optional fast JSON path for viewing saved results
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-# Import project modules
-from config import PROJECT_NAME, DEVELOPER, TELEGRAM, VERSION, COLORS, COUNTRY_CODES, check_installation
-from utils import print_banner, print_message, clear_screen, save_results, load_results, display_result
+# Import project modules (utils initializes colorama once)
+from config import PROJECT_NAME, DEVELOPER, TELEGRAM, VERSION, COLORS, COUNTRY_CODES, check_installation, detect_country_code
+from utils import print_banner, print_message, clear_screen, save_results, save_results_bulk, load_results, display_result
 from truecaller_api import TruecallerAPI
 
 def check_dependencies():
@@ -29,12 +33,11 @@ def check_dependencies():
         print_message('info', "Please restart the application")
         sys.exit(1)
 
-def show_menu():
-    """Display main menu"""
-    print(f"""
+# Menu text is invariant at runtime, so interpolate it once at import
+_MENU = f"""
 {COLORS['cyan']}=== {PROJECT_NAME} v{VERSION} ==={COLORS['reset']}
 {COLORS['success']}1.{COLORS['reset']} Single Number Lookup
-{COLORS['success']}2.{COLORS['reset']} Bulk Number Lookup  
+{COLORS['success']}2.{COLORS['reset']} Bulk Number Lookup
 {COLORS['success']}3.{COLORS['reset']} View Saved Results
 {COLORS['success']}4.{COLORS['reset']} Country Codes
 {COLORS['success']}5.{COLORS['reset']} Check API Status
@@ -45,22 +48,40 @@ def show_menu():
 {COLORS['info']}Developer: {DEVELOPER}
 Telegram: {TELEGRAM}{COLORS['reset']}
 {COLORS['warning']}Powered by truecallerpy API{COLORS['reset']}
-    """)
+    """
+
+def show_menu():
+    """Display main menu"""
+    print(_MENU)
+
+# Pure-membership checks are marginally faster on a frozenset, and it
+# documents that the prompt helpers never mutate the table
+_COUNTRY_CODE_SET = frozenset(COUNTRY_CODES)
+
+# Splits pasted input on any run of whitespace, commas or semicolons,
+# so one line (or file) can carry many numbers
+_SPLIT_RE = re.compile(r'[\s,;]+')
+
+def _read_country_code(default="IN"):
+    """Prompt for a country code"""
+    country_code = input(f"{COLORS['cyan']}Country code (IN, US, BD etc) [{default}]: {COLORS['reset']}").strip().upper() or default
+    if country_code not in _COUNTRY_CODE_SET:
+        print_message('warning', f"Country code {country_code} not in list, but trying anyway...")
+    return country_code
 
 def single_lookup():
     """Handle single number lookup"""
     print(f"\n{COLORS['warning']}=== SINGLE NUMBER LOOKUP ==={COLORS['reset']}")
-    
+
     phone_number = input(f"{COLORS['cyan']}Enter phone number (with country code): {COLORS['reset']}").strip()
-    country_code = input(f"{COLORS['cyan']}Country code (IN, US, BD etc) [IN]: {COLORS['reset']}").strip().upper() or "IN"
-    
+    # Prefill the prompt from the number's calling-code prefix
+    detected = detect_country_code(phone_number) if phone_number.startswith('+') else None
+    country_code = _read_country_code(detected or "IN")
+
     if not phone_number:
         print_message('error', "Phone number required!")
         return
-    
-    if country_code not in COUNTRY_CODES:
-        print_message('warning', f"Country code {country_code} not in list, but trying anyway...")
-    
+
     api = TruecallerAPI()
     result = api.search_number(phone_number, country_code)
     
@@ -76,21 +97,41 @@ def bulk_lookup():
     """Handle bulk number lookup"""
     print(f"\n{COLORS['warning']}=== BULK NUMBER LOOKUP ==={COLORS['reset']}")
     print(f"{COLORS['info']}Enter phone numbers (one per line). Type 'done' to finish:{COLORS['reset']}")
+    print(f"{COLORS['info']}Tip: 'file <path>' loads numbers from a file (one per line){COLORS['reset']}")
     print(f"{COLORS['warning']}Note: Bulk search may take time due to rate limiting{COLORS['reset']}")
-    
+
     phone_numbers = []
-    
+
     while True:
         try:
             number = input().strip()
-            if number.lower() == 'done':
-                break
-            if number:
-                phone_numbers.append(number)
+        except EOFError:
+            # End of piped input
+            break
         except KeyboardInterrupt:
             print_message('warning', "Input interrupted")
             break
-    
+
+        if number.lower() == 'done':
+            break
+        if number.lower().startswith('file '):
+            path = number[5:].strip()
+            try:
+                # One read, one split - no per-line Python loop
+                with open(path, 'r', encoding='utf-8') as f:
+                    loaded = [n for n in _SPLIT_RE.split(f.read()) if n]
+                phone_numbers.extend(loaded)
+                print_message('success', f"Loaded {len(loaded)} numbers from {path}")
+            except OSError as e:
+                print_message('error', f"Could not read {path}: {e}")
+            continue
+        if number:
+            # A line may carry several comma/semicolon/space-separated numbers
+            phone_numbers.extend(n for n in _SPLIT_RE.split(number) if n)
+
+    # Drop duplicates while keeping first-seen order
+    phone_numbers = list(dict.fromkeys(phone_numbers))
+
     if not phone_numbers:
         print_message('error', "No numbers provided!")
         return
@@ -101,10 +142,19 @@ def bulk_lookup():
         if confirm not in ['y', 'yes']:
             return
     
-    country_code = input(f"{COLORS['cyan']}Country code (IN, US, BD etc) [IN]: {COLORS['reset']}").strip().upper() or "IN"
-    
+    country_code = _read_country_code()
+
+    stream_to = None
+    if len(phone_numbers) > 10:
+        # Large batches stream to disk as they run, so an interrupted
+        # session keeps its partial results
+        stream_to = os.path.join(
+            "results", f"xloockup_stream_{time.strftime('%Y%m%d_%H%M%S')}.jsonl"
+        )
+        print_message('info', f"Streaming results to {stream_to} as they arrive")
+
     api = TruecallerAPI()
-    results = api.bulk_search(phone_numbers, country_code)
+    results = api.bulk_search(phone_numbers, country_code, stream_to=stream_to)
     
     # Display summary
     successful = sum(1 for r in results.values() if r and 'error' not in r)
@@ -121,7 +171,7 @@ def bulk_lookup():
     
     save_choice = input(f"\n{COLORS['cyan']}Save all results? (y/n): {COLORS['reset']}").lower()
     if save_choice in ['y', 'yes']:
-        save_results("bulk_search", results, "bulk")
+        save_results_bulk(results)
 
 def view_saved_results():
     """View previously saved results"""
@@ -146,11 +196,30 @@ def view_saved_results():
             selected_file = files[selected_index]
             filepath = os.path.join("results", selected_file)
             
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+
+            if len(raw) > 1_000_000:
+                # Too big to re-indent in memory - show it as stored
+                print(f"\n{COLORS['success']}=== {selected_file} ==={COLORS['reset']}")
+                sys.stdout.write(raw.decode('utf-8', 'replace'))
+                sys.stdout.write('\n')
+                return
+
+            loads = orjson.loads if orjson is not None else json.loads
+            if selected_file.endswith('.jsonl'):
+                # One record per line - show them as a list
+                data = [loads(line) for line in raw.splitlines() if line.strip()]
+            else:
+                data = loads(raw)
+
+            if orjson is not None:
+                pretty = orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+            else:
+                pretty = json.dumps(data, indent=2, ensure_ascii=False)
+
             print(f"\n{COLORS['success']}=== {selected_file} ==={COLORS['reset']}")
-            print(json.dumps(data, indent=2, ensure_ascii=False))
+            print(pretty)
         else:
             print_message('error', "Invalid selection!")
             
@@ -161,9 +230,12 @@ def view_saved_results():
 
 def show_country_codes():
     """Display available country codes"""
-    print(f"\n{COLORS['warning']}=== SUPPORTED COUNTRY CODES ==={COLORS['reset']}")
-    for code, country in COUNTRY_CODES.items():
-        print(f"{COLORS['success']}{code}:{COLORS['reset']} {country}")
+    c_success, c_reset = COLORS['success'], COLORS['reset']
+    listing = '\n'.join(
+        f"{c_success}{code}:{c_reset} {country}"
+        for code, country in COUNTRY_CODES.items()
+    )
+    sys.stdout.write(f"\n{COLORS['warning']}=== SUPPORTED COUNTRY CODES ==={c_reset}\n{listing}\n")
 
 def check_api_status():
     """Check if Truecaller API is accessible"""
@@ -191,8 +263,33 @@ def set_api_key():
     else:
         print_message('error', "No API key provided!")
 
+def _refresh_screen():
+    """Clear and redraw the banner (menu option 7)"""
+    clear_screen()
+    print_banner()
+
+# Menu dispatch table - adding an option is an entry here plus a line in
+# the menu text, not another elif branch
+_MENU_HANDLERS = {
+    '1': single_lookup,
+    '2': bulk_lookup,
+    '3': view_saved_results,
+    '4': show_country_codes,
+    '5': check_api_status,
+    '6': set_api_key,
+    '7': _refresh_screen
+}
+
 def main():
     """Main application loop"""
+    # uvloop speeds up the asyncio bulk path; POSIX-only, so fall back
+    # quietly where it isn't installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Check dependencies first
     check_dependencies()
     
@@ -204,24 +301,13 @@ def main():
             show_menu()
             choice = input(f"{COLORS['cyan']}Select option (1-8): {COLORS['reset']}").strip()
             
-            if choice == '1':
-                single_lookup()
-            elif choice == '2':
-                bulk_lookup()
-            elif choice == '3':
-                view_saved_results()
-            elif choice == '4':
-                show_country_codes()
-            elif choice == '5':
-                check_api_status()
-            elif choice == '6':
-                set_api_key()
-            elif choice == '7':
-                clear_screen()
-                print_banner()
-            elif choice == '8':
+            if choice == '8':
                 print_message('success', "Thank you for using Xloockup v2.0! - t.me/alwayszihan")
                 break
+
+            handler = _MENU_HANDLERS.get(choice)
+            if handler:
+                handler()
             else:
                 print_message('error', "Invalid choice! Please select 1-8.")
             